@@ -11,22 +11,37 @@ Data sources:
 
 How it works (high level):
 1) Resolve the forecast endpoints for a lat/lon (Joplin) via /points.
-2) Pull next-24h hourly forecast; extract thunder mentions, max PoP, and wind gusts.
+2) Pull the next-24h gridpoint forecast (forecastGridData); extract thunderstorm hours,
+   max PoP, and wind gusts. The hourly forecast text is used if no grid URL is published.
 3) Check active NWS alerts at that point (Tornado Watch/Warning lift the score).
 4) Query SPC polygons for the point to get categorical risk (MRGL/SLGT/ENH/MDT/HIGH)
    and probabilistic tornado percentage (e.g., 2%, 5%, 10%, 15%, 30%).
 5) Combine into a 0–100 score with a transparent, explainable heuristic.
 
-You can adapt lat/lon to any location.
+You can adapt lat/lon to any location. API responses are cached under ~/.cache/tornado
+(or $XDG_CACHE_HOME/tornado) for as long as the upstream data is expected to stay current.
 """
 
 import datetime as dt
+import hashlib
+import json
 import math
+import os
 import re
 import sys
-from typing import Dict, Any, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Any, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # optional: faster decoding of the (large) API responses
+except ImportError:
+    orjson = None
 
 
 # -----------------------------
@@ -38,7 +53,8 @@ LON = -94.5133
 # User-Agent is required by api.weather.gov policy; include contact info
 HEADERS = {
     "User-Agent": "TornadoHeuristicDemo/1.0 (your_email@example.com)",
-    "Accept": "application/geo+json"
+    "Accept": "application/geo+json",
+    "Accept-Encoding": "gzip",  # both APIs gzip JSON; requests decompresses transparently
 }
 
 # SPC MapServer base and layer IDs (per NOAA ArcGIS service)
@@ -46,6 +62,71 @@ SPC_BASE = "https://mapservices.weather.noaa.gov/vector/rest/services/outlooks/S
 LAYER_DAY1_CATEGORICAL = 1            # MRGL/SLGT/ENH/MDT/HIGH
 LAYER_DAY1_PROB_TORNADO = 3           # e.g., 2%, 5%, 10%, 15%, 30%, 45%
 
+# Attributes the parsers actually read, per layer (keeps SPC responses small).
+# Only names in the layers' published schema: ArcGIS rejects the whole query if
+# outFields lists a field the layer doesn't have.
+SPC_OUT_FIELDS = {
+    LAYER_DAY1_CATEGORICAL: "label,label2",
+    LAYER_DAY1_PROB_TORNADO: "label,label2,dn",   # dn = numeric probability
+}
+
+# Point-query string per layer, encoded once; only the geometry is appended per call.
+# Layers without an SPC_OUT_FIELDS entry get every attribute.
+def _spc_query_string(out_fields: str) -> str:
+    return ("f=json&geometryType=esriGeometryPoint&inSR=4326&spatialRel=esriSpatialRelIntersects"
+            f"&outFields={out_fields}&returnGeometry=false")
+
+_SPC_QUERY = {layer_id: _spc_query_string(out_fields) for layer_id, out_fields in SPC_OUT_FIELDS.items()}
+_SPC_QUERY_ALL_FIELDS = _spc_query_string("*")
+
+# Requests main() runs on worker threads (alerts, 2x SPC); /points and the
+# grid/hourly forecast that depends on it run on the main thread meanwhile
+MAX_WORKERS = 3
+
+# Shared HTTP session: keep-alive connections to both hosts are reused across calls.
+# The pool is bounded by the concurrency in main(): one pool per host, and at most
+# one connection per worker thread plus one for the main thread.
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+_ADAPTER = HTTPAdapter(
+    pool_connections=2,
+    pool_maxsize=MAX_WORKERS + 1,
+    pool_block=True,
+    # Transient 429/5xx and dropped connections are retried with exponential backoff;
+    # if they persist, the last response is returned and raise_for_status() reports it.
+    max_retries=Retry(
+        total=3,
+        connect=3,
+        read=2,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET"]),
+        raise_on_status=False,
+    ),
+)
+SESSION.mount("https://api.weather.gov", _ADAPTER)
+SESSION.mount("https://mapservices.weather.noaa.gov", _ADAPTER)
+
+# Seconds to establish a connection; read timeouts are set per endpoint
+CONNECT_TIMEOUT = 3.05
+
+# On-disk response cache (seconds). /points rarely changes for a fixed coordinate;
+# NWS grids and SPC outlooks update at most hourly; alerts need to stay fresh.
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "tornado"
+TTL_POINTS = 7 * 24 * 3600
+TTL_FORECAST = 3600
+TTL_SPC = 3600
+TTL_ALERTS = 60
+
+KMH_TO_MPH = 0.621371
+
+# Patterns used while parsing SPC labels and gridpoint validTime durations
+_PCT_RE = re.compile(r"(\d+)\s*%")
+_DURATION_RE = re.compile(r"P(?:(\d+)D)?(?:T(\d+)H)?")   # e.g. PT3H, P1DT6H
+
+# Categorical risk tokens as they appear in SPC labels (disjoint, so at most one matches)
+_CAT_TOKENS = ("TSTM", "HIGH", "MDT", "ENH", "SLGT", "MRGL")
+
 # -----------------------------
 # Utility helpers
 # -----------------------------
@@ -68,6 +149,50 @@ def safe_get(d: Dict, *keys, default=None):
         cur = cur[k]
     return cur
 
+def _json_loads(raw: bytes) -> Any:
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+def fetch_json(
+    url: str,
+    read_timeout: float = 30,
+    ttl: int = 0,
+    validate: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """
+    GET a JSON document through SESSION (connect timeout CONNECT_TIMEOUT, then
+    read_timeout seconds for the response). If ttl > 0, a cached copy younger than
+    ttl seconds is returned instead, and fresh responses are written to CACHE_DIR.
+
+    validate, if given, raises RuntimeError for documents that must not be used;
+    a rejected response is raised to the caller and never cached.
+    """
+    path = CACHE_DIR / f"{hashlib.blake2b(url.encode(), digest_size=16).hexdigest()}.json"
+    if ttl > 0:
+        try:
+            if time.time() - path.stat().st_mtime < ttl:
+                data = _json_loads(path.read_bytes())
+                if validate:
+                    validate(data)
+                return data
+        except (OSError, ValueError, RuntimeError):
+            pass  # missing, unreadable, corrupt or rejected cache entry: refetch
+
+    r = SESSION.get(url, timeout=(CONNECT_TIMEOUT, read_timeout))
+    r.raise_for_status()
+    data = _json_loads(r.content)
+    if validate:
+        validate(data)
+
+    if ttl > 0:
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_bytes(r.content)  # already valid JSON; no need to re-encode
+            tmp.replace(path)
+        except OSError:
+            pass  # caching is best-effort
+    return data
+
 # -----------------------------
 # Step 1: Resolve NWS endpoints
 # -----------------------------
@@ -76,22 +201,124 @@ def get_points_metadata(lat: float, lon: float) -> Dict[str, Any]:
     Calls api.weather.gov/points/{lat},{lon} to discover forecast URLs.
     """
     url = f"https://api.weather.gov/points/{lat:.4f},{lon:.4f}"
-    r = requests.get(url, headers=HEADERS, timeout=20)
-    r.raise_for_status()
-    return r.json()
+    return fetch_json(url, read_timeout=20, ttl=TTL_POINTS)
 
 # -----------------------------
-# Step 2: Hourly forecast (24h)
+# Step 2: Gridpoint / hourly forecast (24h)
 # -----------------------------
+# Gridpoint layers summarize_grid() reads; without any of them the hourly forecast is used
+GRID_LAYERS = ("weather", "probabilityOfPrecipitation", "windGust")
+
+def _require_grid_layers(data: Dict[str, Any]) -> None:
+    for layer in GRID_LAYERS:
+        if not safe_get(data, "properties", layer, "values"):
+            raise RuntimeError(f"Gridpoint forecast has no '{layer}' values.")
+
+def get_grid_data(grid_url: str) -> Dict[str, Any]:
+    """
+    Fetch gridpoint forecast layers (time series of {validTime, value}) from the provided URL.
+    Raises RuntimeError if any of GRID_LAYERS is missing or empty.
+    """
+    data = fetch_json(grid_url, read_timeout=30, ttl=TTL_FORECAST, validate=_require_grid_layers)
+    return data["properties"]
+
+def _parse_valid_time(valid_time: str) -> tuple[dt.datetime, int]:
+    """
+    Split a gridpoint validTime like '2024-05-01T12:00:00+00:00/PT3H' into (start, hours).
+    """
+    start, _, duration = valid_time.partition("/")
+    m = _DURATION_RE.fullmatch(duration)
+    if not m:
+        raise ValueError(f"Unsupported validTime duration: {duration!r}")
+    days, hours = (int(g or 0) for g in m.groups())
+    return _parse_iso(start), days * 24 + hours
+
+def _grid_values_in_window(grid: Dict[str, Any], layer: str, start_utc: dt.datetime, end_utc: dt.datetime):
+    """
+    Yield (value, hours) for each entry of a gridpoint layer, where hours counts the
+    entry's hourly steps that start in [start_utc, end_utc); entries outside are skipped.
+    """
+    for entry in safe_get(grid, layer, "values", default=[]) or []:
+        try:
+            t, span = _parse_valid_time(entry["validTime"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        first = max(0, math.ceil((start_utc - t).total_seconds() / 3600))
+        last = min(span, math.ceil((end_utc - t).total_seconds() / 3600))
+        if last > first:
+            yield entry.get("value"), last - first
+
+def summarize_grid(grid: Dict[str, Any], start_utc: dt.datetime, end_utc: dt.datetime) -> Dict[str, Any]:
+    """
+    Same summary as summarize_hourly(), read from the gridpoint time series for [start_utc, end_utc):
+      - thunder_hours: hours whose 'weather' layer includes thunderstorms
+      - max_pop: maximum probabilityOfPrecipitation (%)
+      - max_gust_mph: maximum windGust in mph (the layer is usually km/h)
+    """
+    thunder_hours = 0
+    for value, hours in _grid_values_in_window(grid, "weather", start_utc, end_utc):
+        if any(isinstance(w, dict) and w.get("weather") == "thunderstorms" for w in value or []):
+            thunder_hours += hours
+
+    max_pop = 0
+    for value, _ in _grid_values_in_window(grid, "probabilityOfPrecipitation", start_utc, end_utc):
+        if isinstance(value, (int, float)) and value > max_pop:
+            max_pop = min(100, int(value))
+
+    to_mph = KMH_TO_MPH if str(safe_get(grid, "windGust", "uom", default="")).endswith("km_h-1") else 1.0
+    max_gust_mph = 0
+    for value, _ in _grid_values_in_window(grid, "windGust", start_utc, end_utc):
+        if isinstance(value, (int, float)) and value * to_mph > max_gust_mph:
+            max_gust_mph = int(value * to_mph)
+
+    return {
+        "thunder_hours": thunder_hours,
+        "max_pop": max_pop,
+        "max_gust_mph": max_gust_mph,
+    }
+
 def get_hourly_forecast(hourly_url: str) -> list[Dict[str, Any]]:
     """
     Fetch hourly forecast periods from the provided URL.
     """
-    r = requests.get(hourly_url, headers=HEADERS, timeout=30)
-    r.raise_for_status()
-    data = r.json()
+    data = fetch_json(hourly_url, read_timeout=30, ttl=TTL_FORECAST)
     return data.get("properties", {}).get("periods", [])
 
+def _parse_iso(ts: str) -> dt.datetime:
+    return dt.datetime.fromisoformat(ts.replace("Z", "+00:00"))
+
+def slice_next_24h(periods: list[Dict[str, Any]], start_utc: dt.datetime, end_utc: dt.datetime) -> list[Dict[str, Any]]:
+    """
+    Return the periods whose startTime falls in [start_utc, end_utc).
+
+    NWS hourly periods are ordered at a 1-hour cadence, so the window is located
+    from the first period's startTime alone and checked at both ends of the slice;
+    if the feed doesn't look like that, every period is parsed instead.
+    """
+    try:
+        t0 = _parse_iso(periods[0]["startTime"])
+        lo = max(0, math.ceil((start_utc - t0).total_seconds() / 3600))
+        hi = min(len(periods), max(0, math.ceil((end_utc - t0).total_seconds() / 3600)))
+        window = periods[lo:hi]
+        hour = dt.timedelta(hours=1)
+        if (window
+                and _parse_iso(window[0]["startTime"]) == t0 + lo * hour
+                and _parse_iso(window[-1]["startTime"]) == t0 + (hi - 1) * hour):
+            return window
+    except (IndexError, KeyError, TypeError, ValueError):
+        pass
+
+    next24 = []
+    for p in periods:
+        # Parse start time of each hourly period
+        ts = p.get("startTime")
+        if not ts:
+            continue
+        t = _parse_iso(ts)
+        if start_utc <= t < end_utc:
+            next24.append(p)
+    return next24
+
 def summarize_hourly(periods_24h: list[Dict[str, Any]]) -> Dict[str, Any]:
     """
     From next-24h periods, summarize:
@@ -99,37 +326,43 @@ def summarize_hourly(periods_24h: list[Dict[str, Any]]) -> Dict[str, Any]:
       - max_pop: maximum Probability of Precipitation (%)
       - max_gust_mph: maximum wind gust in mph (if available)
     """
-    thunder_re = re.compile(r"(thunder|t-storm|storm)", re.I)
-
     thunder_hours = 0
     max_pop = 0
     max_gust_mph = 0
 
     for p in periods_24h:
         # NWS hourly fields commonly include: shortForecast, probabilityOfPrecipitation.value, windGust
-        sf = p.get("shortForecast", "") or ""
-        if thunder_re.search(sf):
+        sf = (p.get("shortForecast") or "").lower()
+        if "thunder" in sf or "t-storm" in sf or "storm" in sf:
             thunder_hours += 1
 
-        pop = safe_get(p, "probabilityOfPrecipitation", "value", default=0) or 0
-        # probability may be None; clamp to [0,100]
+        # probability may be missing or None; clamp to [0,100]
         try:
-            pop = max(0, min(100, int(pop)))
-        except Exception:
+            pop = int(p["probabilityOfPrecipitation"]["value"] or 0)
+        except (KeyError, TypeError, ValueError, OverflowError):
             pop = 0
-        max_pop = max(max_pop, pop)
-
-        gust = p.get("windGust")  # sometimes "windGust" is a string like "25 mph"; sometimes None
-        gust_mph = 0
-        if isinstance(gust, str):
-            m = re.search(r"(\d+)", gust)
-            if m:
-                gust_mph = int(m.group(1))
-        elif isinstance(gust, (int, float)):
-            gust_mph = float(gust)
+        if pop > max_pop:
+            max_pop = pop if pop < 100 else 100
+
+        # "windGust" is a string like "25 mph" in hourly feeds, a {"unitCode", "value"}
+        # quantity in gridpoint feeds, and sometimes None
+        gust = p.get("windGust")
+        try:
+            if isinstance(gust, str):
+                gust_mph = int(gust.partition(" ")[0])
+            elif isinstance(gust, dict):
+                gust_mph = gust.get("value") or 0
+                if str(gust.get("unitCode", "")).endswith("km_h-1"):
+                    gust_mph *= KMH_TO_MPH
+                gust_mph = int(gust_mph)
+            else:
+                gust_mph = int(gust)
+        except (TypeError, ValueError, OverflowError):
+            gust_mph = 0
         # Some feeds use "windSpeed" and no gusts; you could also parse that as a fallback.
 
-        max_gust_mph = max(max_gust_mph, int(gust_mph))
+        if gust_mph > max_gust_mph:
+            max_gust_mph = gust_mph
 
     return {
         "thunder_hours": thunder_hours,
@@ -146,9 +379,7 @@ def get_active_alerts(lat: float, lon: float) -> list[Dict[str, Any]]:
     """
     # The alerts API supports filtering; here we pull all active for the point and scan.
     url = f"https://api.weather.gov/alerts/active?point={lat:.4f},{lon:.4f}"
-    r = requests.get(url, headers=HEADERS, timeout=30)
-    r.raise_for_status()
-    data = r.json()
+    data = fetch_json(url, read_timeout=30, ttl=TTL_ALERTS)
     return data.get("features", []) or []
 
 def classify_tornado_alerts(features: list[Dict[str, Any]]) -> Dict[str, bool]:
@@ -160,17 +391,25 @@ def classify_tornado_alerts(features: list[Dict[str, Any]]) -> Dict[str, bool]:
     has_pds = False
 
     for f in features:
-        event = safe_get(f, "properties", "event", default="") or ""
-        headline = safe_get(f, "properties", "headline", default="") or ""
-        desc = safe_get(f, "properties", "description", default="") or ""
-        txt = f"{event} {headline} {desc}".lower()
-
-        if "tornado warning" in txt:
-            has_warning = True
-        if "tornado watch" in txt:
-            has_watch = True
-        if "particularly dangerous situation" in txt or "pds" in txt:
-            has_pds = True
+        # Scan the short event name first and only lowercase the (often long) headline
+        # and description while some flag is still unset.
+        for key in ("event", "headline", "description"):
+            try:
+                txt = str(f["properties"][key] or "").lower()
+            except (KeyError, TypeError):
+                txt = ""
+
+            if "tornado warning" in txt:
+                has_warning = True
+            if "tornado watch" in txt:
+                has_watch = True
+            if "particularly dangerous situation" in txt or "pds" in txt:
+                has_pds = True
+
+            if has_watch and has_warning and has_pds:
+                break
+        if has_watch and has_warning and has_pds:
+            break  # remaining alerts cannot change the result
 
     return {
         "has_watch": has_watch,
@@ -183,63 +422,75 @@ def classify_tornado_alerts(features: list[Dict[str, Any]]) -> Dict[str, bool]:
 # ---------------------------------------------------------
 def _spc_point_query(layer_id: int, lat: float, lon: float) -> Dict[str, Any]:
     """
-    ArcGIS REST 'query' with a point geometry and spatialRel=intersects, return GeoJSON.
-    """
-    url = f"{SPC_BASE}/{layer_id}/query"
-    params = {
-        "f": "geoJSON",
-        "geometry": f"{lon},{lat}",  # x,y = lon,lat
-        "geometryType": "esriGeometryPoint",
-        "inSR": "4326",
-        "spatialRel": "esriSpatialRelIntersects",
-        "outFields": "*",
-        "returnGeometry": "false",
-    }
-    r = requests.get(url, params=params, timeout=30)
-    r.raise_for_status()
-    return r.json()
+    ArcGIS REST 'query' with a point geometry and spatialRel=intersects, return ArcGIS JSON
+    (features carry their fields under 'attributes'; no geometry is requested).
+    """
+    query = _SPC_QUERY.get(layer_id, _SPC_QUERY_ALL_FIELDS)
+    url = f"{SPC_BASE}/{layer_id}/query?{query}&geometry={lon},{lat}"  # x,y = lon,lat
+    return fetch_json(url, read_timeout=30, ttl=TTL_SPC, validate=_raise_for_arcgis_error)
 
-def get_spc_categorical(lat: float, lon: float) -> Optional[str]:
+def _raise_for_arcgis_error(data: Dict[str, Any]) -> None:
     """
-    Returns one of: 'TSTM','MRGL','SLGT','ENH','MDT','HIGH' if point is inside a Day 1 categorical polygon.
+    ArcGIS reports query errors (bad outFields, unknown layer) as an HTTP 200 body
+    {"error": {"code": ..., "message": ...}}; surface them instead of parsing no features.
+    """
+    err = data.get("error") if isinstance(data, dict) else None
+    if err is not None:
+        code = safe_get(err, "code")
+        message = safe_get(err, "message") or err
+        raise RuntimeError(f"SPC query failed ({code}): {message}")
+
+def parse_spc_categorical(data: Dict[str, Any]) -> Optional[str]:
+    """
+    Returns one of: 'TSTM','MRGL','SLGT','ENH','MDT','HIGH' from a Day 1 categorical query response.
     """
-    data = _spc_point_query(LAYER_DAY1_CATEGORICAL, lat, lon)
     feats = data.get("features", [])
     if not feats:
         return None
-    # Common categorical label fields across SPC feeds include 'LABEL' or 'Type'—we'll try both.
-    props = feats[0].get("properties", {})
-    label = props.get("LABEL") or props.get("LABEL2") or props.get("Type") or props.get("label") or ""
+    # The risk token is in 'label' (e.g. 'SLGT'); 'label2' holds the long form
+    props = feats[0].get("attributes", {})
+    label = props.get("label") or props.get("label2") or ""
     # Normalize common text
     label = label.upper().replace(" ", "")
-    # Map a few variants
-    if "TSTM" in label: return "TSTM"
-    for v in ["MRGL", "SLGT", "ENH", "MDT", "HIGH"]:
-        if v in label:
-            return v
-    return None
+    # Pick out the risk token
+    return next((t for t in _CAT_TOKENS if t in label), None)
 
-def get_spc_prob_tornado(lat: float, lon: float) -> Optional[int]:
+def get_spc_categorical(lat: float, lon: float) -> Optional[str]:
     """
-    Returns probabilistic tornado percentage (e.g., 2,5,10,15,30,45) for Day 1 if present.
+    Returns one of: 'TSTM','MRGL','SLGT','ENH','MDT','HIGH' if point is inside a Day 1 categorical polygon.
+    """
+    return parse_spc_categorical(_spc_point_query(LAYER_DAY1_CATEGORICAL, lat, lon))
+
+def parse_spc_prob_tornado(data: Dict[str, Any]) -> Optional[int]:
+    """
+    Returns probabilistic tornado percentage from a Day 1 tornado probability query response.
     """
-    data = _spc_point_query(LAYER_DAY1_PROB_TORNADO, lat, lon)
     feats = data.get("features", [])
     if not feats:
         return None
-    props = feats[0].get("properties", {})
-    # Fields often include 'LABEL' like '5%'; extract the integer
+    props = feats[0].get("attributes", {})
+    # The polygon's percentage is carried as the numeric 'DN' attribute
+    val = props.get("DN") or props.get("dn")
+    if isinstance(val, (int, float)) and not isinstance(val, bool):
+        return int(val)
+    # Otherwise fields often include 'LABEL' like '5%'; extract the integer
     label = (props.get("LABEL") or props.get("label") or "")
-    m = re.search(r"(\d+)\s*%", str(label))
+    m = _PCT_RE.search(str(label))
     if m:
         return int(m.group(1))
     # Sometimes percentage might be in another field; scan all property values
     for v in props.values():
-        m = re.search(r"(\d+)\s*%", str(v))
+        m = _PCT_RE.search(str(v))
         if m:
             return int(m.group(1))
     return None
 
+def get_spc_prob_tornado(lat: float, lon: float) -> Optional[int]:
+    """
+    Returns probabilistic tornado percentage (e.g., 2,5,10,15,30,45) for Day 1 if present.
+    """
+    return parse_spc_prob_tornado(_spc_point_query(LAYER_DAY1_PROB_TORNADO, lat, lon))
+
 # ---------------------------------------------------------
 # Step 5: Combine into a heuristic 0–100 score
 # ---------------------------------------------------------
@@ -312,35 +563,50 @@ def score_likelihood(
 # Orchestration
 # ---------------------------------------------------------
 def main(lat: float = LAT, lon: float = LON):
-    # 1) Resolve forecast URLs for this point
-    points = get_points_metadata(lat, lon)
-    hourly_url = safe_get(points, "properties", "forecastHourly")
-    if not hourly_url:
-        raise RuntimeError("Could not resolve forecastHourly URL from NWS points endpoint.")
-
-    # 2) Pull hourly forecast and slice next 24 hours
-    periods = get_hourly_forecast(hourly_url)
-
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        # Alerts and SPC polygons only need lat/lon, so start them before /points resolves
+        alerts_fut = pool.submit(get_active_alerts, lat, lon)
+        spc_cat_fut = pool.submit(_spc_point_query, LAYER_DAY1_CATEGORICAL, lat, lon)
+        spc_prob_fut = pool.submit(_spc_point_query, LAYER_DAY1_PROB_TORNADO, lat, lon)
+
+        # 1) Resolve forecast URLs for this point
+        points = get_points_metadata(lat, lon)
+        grid_url = safe_get(points, "properties", "forecastGridData")
+        hourly_url = safe_get(points, "properties", "forecastHourly")
+        if not grid_url and not hourly_url:
+            raise RuntimeError("Could not resolve forecastGridData or forecastHourly URL from NWS points endpoint.")
+
+        # 2) Pull the forecast (the only request that depends on /points); prefer the
+        #    structured grid layers, falling back to hourly forecast text if the grid
+        #    can't be fetched or lacks the layers we summarize
+        grid = None
+        if grid_url:
+            try:
+                grid = get_grid_data(grid_url)
+            except (requests.RequestException, RuntimeError, ValueError) as e:
+                if not hourly_url:
+                    raise
+                print(f"WARNING: gridpoint forecast unavailable ({e}); using hourly forecast", file=sys.stderr)
+        if grid is None:
+            periods = get_hourly_forecast(hourly_url)
+
+        active = alerts_fut.result()
+        spc_cat_data = spc_cat_fut.result()
+        spc_prob_data = spc_prob_fut.result()
+
+    # Summarize the next 24 hours
     start_utc, end_utc = next_24h_window()
-    next24 = []
-    for p in periods:
-        # Parse start time of each hourly period
-        ts = p.get("startTime")
-        if not ts:
-            continue
-        t = dt.datetime.fromisoformat(ts.replace("Z", "+00:00"))
-        if start_utc <= t < end_utc:
-            next24.append(p)
-
-    hourly_summary = summarize_hourly(next24)
+    if grid is not None:
+        hourly_summary = summarize_grid(grid, start_utc, end_utc)
+    else:
+        hourly_summary = summarize_hourly(slice_next_24h(periods, start_utc, end_utc))
 
     # 3) Active alerts at the point
-    active = get_active_alerts(lat, lon)
     alert_flags = classify_tornado_alerts(active)
 
     # 4) SPC Day 1 categorical + probabilistic tornado polygons
-    spc_cat = get_spc_categorical(lat, lon)          # e.g., SLGT
-    spc_prob = get_spc_prob_tornado(lat, lon)        # e.g., 5 (meaning 5%)
+    spc_cat = parse_spc_categorical(spc_cat_data)      # e.g., SLGT
+    spc_prob = parse_spc_prob_tornado(spc_prob_data)   # e.g., 5 (meaning 5%)
 
     # 5) Combine into a score
     result = score_likelihood(spc_cat, spc_prob, alert_flags, hourly_summary)